@@ -18,18 +18,28 @@ via GitHub Actions (.github/workflows/update_momentum.yml).
 
 import json
 import os
+import math
 import time
 import datetime
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 warnings.filterwarnings("ignore")
 
 try:
     import yfinance as yf
+    import numpy as np
     import pandas as pd
 except ImportError:
     print("ERROR: Run: pip install yfinance pandas")
     raise
 
+# Optional: faster C-level JSON serialisation (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CONFIGURATION
 # ─────────────────────────────────────────────────────────────────────────────
@@ -131,14 +141,29 @@ TICKERS = [
     ("Oresund", "ORES.ST"),
 ]
 
+# Number of top-ranked stocks saved to the output
+TOP_N = 20
+
 OUTPUT_JSON     = "momentum_data.json"
 PREV_RANKS_FILE = "momentum_prev_ranks.json"
 
+# Local cache of adjusted closes — later runs only download the new days
+PRICE_CACHE_FILE = "momentum_price_cache.csv"
+
+# Trailing cached trading days re-downloaded on each run to detect rescaled history
+PRICE_CACHE_OVERLAP = 5
+
 # Approximate trading days per calendar period
 DAYS_3M  = 65    # ~3 months
 DAYS_6M  = 130   # ~6 months
 DAYS_12M = 260   # ~12 months
 
+# Concurrent workers for the per-ticker fundamentals (.info) requests
+INFO_WORKERS = 16
+
+# Minimum spacing between .info request starts, shared across workers (~5 req/s)
+INFO_MIN_INTERVAL = 0.2
+
 # SEK per USD (approximate — used to convert market cap from USD to SEK)
 # Yahoo Finance returns market cap in USD regardless of listing currency
 USD_TO_SEK = 10.5
@@ -266,52 +291,211 @@ def get_market_cap_msek(info: dict) -> float | None:
     return (mc * USD_TO_SEK) / 1_000_000   # USD → SEK → million SEK
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# FUNDAMENTALS FETCH
+# ─────────────────────────────────────────────────────────────────────────────
+
+_info_lock    = threading.Lock()
+_info_last_ts = 0.0
+
+
+def _throttle_info():
+    """Block until INFO_MIN_INTERVAL has passed since the previous .info request started."""
+    global _info_last_ts
+    with _info_lock:
+        wait = _info_last_ts + INFO_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _info_last_ts = time.monotonic()
+
+
+def fetch_info(symbol: str) -> dict:
+    """
+    Fetch the Yahoo Finance fundamentals dict for one ticker.
+    Runs on a worker thread — the request is I/O-bound, so threads overlap the latency,
+    while _throttle_info() keeps the overall request rate polite.
+    """
+    _throttle_info()
+    return yf.Ticker(symbol).info
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PRICE HISTORY
+# ─────────────────────────────────────────────────────────────────────────────
+
+def download_closes(symbols, start, end):
+    """
+    Download adjusted closes for `symbols` in one batched, threaded yf.download() call.
+    Returns a (trading days × symbols) DataFrame; symbols that came back without
+    any price (failed, rate-limited, delisted) are left out.
+    """
+    data = yf.download(
+        list(symbols),
+        start=start,
+        end=end,
+        auto_adjust=True,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+    if data.empty:
+        return pd.DataFrame(dtype=float)
+    return data.xs("Close", level=1, axis=1).dropna(axis=1, how="all")
+
+
+def get_closes(symbols, start, end):
+    """
+    Return adjusted closes for `symbols` between `start` and `end` (YYYY-MM-DD).
+
+    Closes are kept in PRICE_CACHE_FILE between runs, so normally only the days since
+    the last cached date are downloaded. The last PRICE_CACHE_OVERLAP cached days, plus
+    the day before them, are fetched again as an overlap: Yahoo rescales the adjusted
+    history before an ex-date after a dividend or split, sometimes late. A ticker whose
+    close changed on an overlap day, that is missing overlap days, or that is not cached
+    yet is re-downloaded in full. This only catches ex-dates within the last
+    PRICE_CACHE_OVERLAP cached days; an older ex-date whose rescale Yahoo publishes even
+    later is missed until the affected rows leave the lookback window.
+
+    A failed download never replaces cached prices: tickers missing from a re-download
+    keep their cached column, and the cache file is left untouched when a download
+    returned nothing.
+    """
+    cached = None
+    if os.path.exists(PRICE_CACHE_FILE):
+        try:
+            cached = pd.read_csv(PRICE_CACHE_FILE, index_col=0, parse_dates=True)
+            if not isinstance(cached.index, pd.DatetimeIndex):
+                raise ValueError("index is not a date index")
+        except Exception as e:
+            print("  Ignoring unreadable price cache (" + str(e)[:60] + ")", flush=True)
+            cached = None
+
+    if cached is None or cached.empty or cached.index[0] > pd.Timestamp(start) + pd.Timedelta(days=7):
+        closes = download_closes(symbols, start, end)
+        save   = not closes.empty
+    else:
+        # One extra row before the window, so an ex-date on its first day is still caught
+        overlap = cached.index[-(PRICE_CACHE_OVERLAP + 1):]
+        delta   = download_closes(symbols, overlap[0].strftime("%Y-%m-%d"), end)
+        save    = not delta.empty
+
+        # Only overlap days present in both downloads are compared; a ticker with
+        # missing overlap days is re-downloaded but not assumed to have changed
+        old     = cached.reindex(index=overlap, columns=symbols).to_numpy(dtype=np.float64)
+        new     = delta.reindex(index=overlap, columns=symbols).to_numpy(dtype=np.float64)
+        both    = ~np.isnan(old) & ~np.isnan(new)
+        changed = (both & ~np.isclose(old, new, rtol=1e-6)).any(axis=0)
+        missing = (~np.isnan(old) & np.isnan(new)).any(axis=0)
+        refetch = [s for s, c, m in zip(symbols, changed, missing) if c or m or s not in cached.columns]
+        if delta.empty:
+            refetch = []   # nothing came back at all — don't retry the whole universe
+
+        closes = delta.combine_first(cached).reindex(columns=symbols)
+        if refetch:
+            print("  Re-downloading full history for " + str(len(refetch)) + " tickers", flush=True)
+            full = download_closes(refetch, start, end)
+            save = save and not full.empty
+
+            got  = [s for s in refetch if s in full.columns]
+            kept = [s for s in refetch if s not in full.columns and s in cached.columns]
+            if got:
+                closes = closes.drop(columns=got).join(full[got], how="outer")
+            if kept:
+                closes[kept] = cached[kept].reindex(closes.index)
+
+    closes = closes.reindex(columns=symbols).sort_index().loc[pd.Timestamp(start):]
+    if not save:
+        print("  Price download returned no data — keeping the existing cache", flush=True)
+        return closes
+
+    # Write to a temp file and swap it in, so an interrupted run can't leave a truncated cache
+    tmp_path = PRICE_CACHE_FILE + ".tmp"
+    closes.to_csv(tmp_path)
+    os.replace(tmp_path, PRICE_CACHE_FILE)
+    return closes
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # MOMENTUM CALCULATION
 # ─────────────────────────────────────────────────────────────────────────────
 
-def compute_momentum(name, symbol, prices):
+def compute_momentum(closes):
     """
-    Returns (mom_3m, mom_6m, mom_12m) as percentage returns, or None if data insufficient.
+    Vectorised momentum for the whole universe at once.
+
+    `closes` is a (trading days × tickers) DataFrame of adjusted close prices.
+    Returns (days, price, mom_3m, mom_6m, mom_12m) as numpy arrays aligned with
+    closes.columns: `days` is the number of trading days with a price, the
+    returns are percentages. Returns are NaN where the history is insufficient
+    (fewer than DAYS_12M + 5 days) or a past price is zero.
+
+    Lookbacks count each ticker's own trading days, as a per-ticker dropna() would:
+    gaps in one column, or rows that only some tickers have, don't shift the windows.
     """
-    n = len(prices)
-    if n < DAYS_12M + 5:
-        return None
+    C     = closes.to_numpy(dtype=np.float64)
+    have  = ~np.isnan(C)
+    days  = have.sum(axis=0)
 
-    price_now = float(prices.iloc[-1])
+    # Move each column's prices to the bottom (NaN gaps to the top, order kept), so
+    # row -1 - k is that ticker's own k-th previous trading day
+    C     = np.take_along_axis(C, np.argsort(have, axis=0, kind="stable"), axis=0)
+    price = C[-1] if len(C) else np.full(len(days), np.nan)
 
-    def pct_return(days_back):
-        idx = max(0, n - 1 - days_back)
-        p_past = float(prices.iloc[idx])
-        if p_past == 0 or p_past != p_past:
-            return None
-        return ((price_now / p_past) - 1.0) * 100.0
+    m3, m6, m12 = (np.full(len(days), np.nan) for _ in range(3))
 
-    m3  = pct_return(DAYS_3M)
-    m6  = pct_return(DAYS_6M)
-    m12 = pct_return(DAYS_12M)
+    # Tickers without enough history are dropped up-front, before any returns are
+    # computed; for the rest every lookback row holds a price.
+    valid = np.flatnonzero(days >= DAYS_12M + 5)
+    if len(valid) == 0:
+        return days, price, m3, m6, m12
 
-    if m3 is None or m6 is None or m12 is None:
-        return None
+    V = C[:, valid]
+    p_3m, p_6m, p_12m = V[-1 - DAYS_3M], V[-1 - DAYS_6M], V[-1 - DAYS_12M]
+
+    # A zero past price is the only remaining way a return can be unusable
+    ok  = (p_3m != 0) & (p_6m != 0) & (p_12m != 0)
+    idx = valid[ok]
+    now = V[-1, ok]
 
-    return m3, m6, m12
+    m3[idx]  = ((now / p_3m[ok])  - 1.0) * 100.0
+    m6[idx]  = ((now / p_6m[ok])  - 1.0) * 100.0
+    m12[idx] = ((now / p_12m[ok]) - 1.0) * 100.0
+
+    return days, price, m3, m6, m12
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# PREV RANKS
+# JSON I/O + PREV RANKS
 # ─────────────────────────────────────────────────────────────────────────────
 
+def read_json(path):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(obj, path):
+    """Write compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, separators=(",", ":"), ensure_ascii=False)
+
+
 def load_prev_ranks():
     if os.path.exists(PREV_RANKS_FILE):
-        with open(PREV_RANKS_FILE) as f:
-            return json.load(f)
+        return read_json(PREV_RANKS_FILE)
     return {}
 
 
 def save_prev_ranks(top20):
     ranks = {r["ticker"]: r["rank"] for r in top20}
-    with open(PREV_RANKS_FILE, "w") as f:
-        json.dump(ranks, f)
+    write_json(ranks, PREV_RANKS_FILE)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -335,129 +519,157 @@ def main():
     print("=" * 65)
     print("")
 
-    results = []
-    skipped = []
+    # Survivors are collected column-wise (index into the momentum arrays plus
+    # fundamentals); row dicts are only built for the stocks that get emitted.
+    res_name   = []
+    res_col    = []
+    res_cap    = []
+    res_fscore = []
+    skipped    = []
+
+    # Batched, threaded download for the whole universe — incremental when a
+    # price cache from an earlier run exists.
+    print("Loading price history...", flush=True)
+    closes = get_closes(
+        [symbol for _, symbol in TICKERS],
+        start_date.strftime("%Y-%m-%d"),
+        end_date.strftime("%Y-%m-%d"),
+    )
+    days_arr, price_arr, m3_arr, m6_arr, m12_arr = compute_momentum(closes)
+    col = {symbol: j for j, symbol in enumerate(closes.columns)}
+    print("")
 
-    for i, (name, symbol) in enumerate(TICKERS):
-        print("[" + str(i + 1).rjust(3) + "/" + str(total) + "] " + symbol.ljust(20), end="", flush=True)
+    # Fundamentals are still one request per ticker — fetch them concurrently
+    # for every ticker with usable momentum, and consume them in order below.
+    eligible = [symbol for symbol, j in col.items() if not math.isnan(m12_arr[j])]
 
-        try:
-            stock = yf.Ticker(symbol)
-            hist  = stock.history(
-                start=start_date.strftime("%Y-%m-%d"),
-                end=end_date.strftime("%Y-%m-%d"),
-                auto_adjust=True
-            )
-
-            if hist.empty or len(hist) == 0:
-                skipped.append({"name": name, "ticker": symbol, "reason": "No price data", "days_available": 0})
-                print("✗  No price data")
-                time.sleep(0.3)
-                continue
-
-            prices = hist["Close"].dropna()
-            days   = len(prices)
-
-            mom = compute_momentum(name, symbol, prices)
-            if mom is None:
-                skipped.append({
-                    "name": name, "ticker": symbol,
-                    "reason": "Insufficient history (need " + str(DAYS_12M + 5) + "d, have " + str(days) + "d)",
-                    "days_available": days
-                })
-                print("✗  Only " + str(days) + "/" + str(DAYS_12M + 5) + " trading days")
-                time.sleep(0.3)
-                continue
-
-            m3, m6, m12 = mom
-            compound = round(m3 + m6 + m12, 2)
-
-            # Fetch fundamentals (needed for size + fscore filters, and always stored)
-            info = stock.info
-
-            # ── Market cap ────────────────────────────────────────────────────
-            market_cap_msek = get_market_cap_msek(info)
-
-            if FILTER_BY_SIZE:
-                if market_cap_msek is None:
-                    skipped.append({
-                        "name": name, "ticker": symbol,
-                        "reason": "Filtered: market cap unavailable",
-                        "days_available": days
-                    })
-                    print("✗  Filtered: market cap unavailable")
-                    time.sleep(0.3)
-                    continue
-                if market_cap_msek < MIN_MARKET_CAP_MSEK:
-                    skipped.append({
-                        "name": name, "ticker": symbol,
-                        "reason": "Filtered: market cap " + str(round(market_cap_msek)) + " MSEK < " + str(MIN_MARKET_CAP_MSEK) + " MSEK minimum",
-                        "days_available": days
-                    })
-                    print("✗  Filtered: " + str(round(market_cap_msek)) + " MSEK < min " + str(MIN_MARKET_CAP_MSEK) + " MSEK")
-                    time.sleep(0.3)
-                    continue
+    with ThreadPoolExecutor(max_workers=INFO_WORKERS) as pool:
+        info_futures = {symbol: pool.submit(fetch_info, symbol) for symbol in eligible}
 
-            # ── Piotroski F-Score ─────────────────────────────────────────────
-            fscore = compute_fscore(info)
+        for i, (name, symbol) in enumerate(TICKERS):
+            # Each ticker's status goes out as a single print once its outcome is known
+            line = "[" + str(i + 1).rjust(3) + "/" + str(total) + "] " + symbol.ljust(20)
 
-            if FILTER_BY_FSCORE:
-                if fscore is None:
-                    skipped.append({
-                        "name": name, "ticker": symbol,
-                        "reason": "Filtered: F-Score could not be computed (insufficient fundamental data)",
-                        "days_available": days
-                    })
-                    print("✗  Filtered: F-Score unavailable")
-                    time.sleep(0.3)
+            try:
+                j    = col.get(symbol)
+                days = int(days_arr[j]) if j is not None else 0
+
+                if days == 0:
+                    skipped.append({"name": name, "ticker": symbol, "reason": "No price data", "days_available": 0})
+                    print(line + "✗  No price data")
                     continue
-                if fscore < MIN_FSCORE:
+
+                if math.isnan(m12_arr[j]):
                     skipped.append({
                         "name": name, "ticker": symbol,
-                        "reason": "Filtered: F-Score " + str(fscore) + " < minimum " + str(MIN_FSCORE),
+                        "reason": "Insufficient history (need " + str(DAYS_12M + 5) + "d, have " + str(days) + "d)",
                         "days_available": days
                     })
-                    print("✗  Filtered: F-Score=" + str(fscore) + " < min " + str(MIN_FSCORE))
-                    time.sleep(0.3)
+                    print(line + "✗  Only " + str(days) + "/" + str(DAYS_12M + 5) + " trading days")
                     continue
 
-            results.append({
-                "name":             name,
-                "ticker":           symbol,
-                "price":            round(float(prices.iloc[-1]), 2),
-                "mom_3m":           round(m3, 2),
-                "mom_6m":           round(m6, 2),
-                "mom_12m":          round(m12, 2),
-                "compound_score":   compound,
-                "market_cap_msek":  round(market_cap_msek) if market_cap_msek else None,
-                "fscore":           fscore,
-            })
-
-            cap_str    = (str(round(market_cap_msek)) + "MSEK").rjust(10) if market_cap_msek else "    N/A MSEK"
-            fscore_str = ("F=" + str(fscore)) if fscore is not None else "F=N/A"
-            print("✓  3M=" + str(round(m3, 1)).rjust(7) + "%"
-                  "  6M=" + str(round(m6, 1)).rjust(7) + "%"
-                  "  12M=" + str(round(m12, 1)).rjust(7) + "%"
-                  "  COMPOUND=" + str(compound).rjust(8) + "%"
-                  "  " + cap_str + "  " + fscore_str)
-
-        except Exception as e:
-            skipped.append({"name": name, "ticker": symbol, "reason": "Error: " + str(e)[:60], "days_available": 0})
-            print("✗  " + str(e)[:50])
-
-        time.sleep(0.3)
+                m3, m6, m12 = float(m3_arr[j]), float(m6_arr[j]), float(m12_arr[j])
+                compound = round(m3 + m6 + m12, 2)
+
+                # Fetch fundamentals (needed for size + fscore filters, and always stored)
+                info = info_futures[symbol].result()
+
+                # ── Market cap ────────────────────────────────────────────────
+                market_cap_msek = get_market_cap_msek(info)
+
+                if FILTER_BY_SIZE:
+                    if market_cap_msek is None:
+                        skipped.append({
+                            "name": name, "ticker": symbol,
+                            "reason": "Filtered: market cap unavailable",
+                            "days_available": days
+                        })
+                        print(line + "✗  Filtered: market cap unavailable")
+                        continue
+                    if market_cap_msek < MIN_MARKET_CAP_MSEK:
+                        skipped.append({
+                            "name": name, "ticker": symbol,
+                            "reason": "Filtered: market cap " + str(round(market_cap_msek)) + " MSEK < " + str(MIN_MARKET_CAP_MSEK) + " MSEK minimum",
+                            "days_available": days
+                        })
+                        print(line + "✗  Filtered: " + str(round(market_cap_msek)) + " MSEK < min " + str(MIN_MARKET_CAP_MSEK) + " MSEK")
+                        continue
+
+                # ── Piotroski F-Score ─────────────────────────────────────────
+                fscore = compute_fscore(info)
+
+                if FILTER_BY_FSCORE:
+                    if fscore is None:
+                        skipped.append({
+                            "name": name, "ticker": symbol,
+                            "reason": "Filtered: F-Score could not be computed (insufficient fundamental data)",
+                            "days_available": days
+                        })
+                        print(line + "✗  Filtered: F-Score unavailable")
+                        continue
+                    if fscore < MIN_FSCORE:
+                        skipped.append({
+                            "name": name, "ticker": symbol,
+                            "reason": "Filtered: F-Score " + str(fscore) + " < minimum " + str(MIN_FSCORE),
+                            "days_available": days
+                        })
+                        print(line + "✗  Filtered: F-Score=" + str(fscore) + " < min " + str(MIN_FSCORE))
+                        continue
+
+                res_name.append(name)
+                res_col.append(j)
+                res_cap.append(round(market_cap_msek) if market_cap_msek else None)
+                res_fscore.append(fscore)
+
+                cap_str    = (str(round(market_cap_msek)) + "MSEK").rjust(10) if market_cap_msek else "    N/A MSEK"
+                fscore_str = ("F=" + str(fscore)) if fscore is not None else "F=N/A"
+                print(line + "✓  3M=" + str(round(m3, 1)).rjust(7) + "%"
+                             "  6M=" + str(round(m6, 1)).rjust(7) + "%"
+                             "  12M=" + str(round(m12, 1)).rjust(7) + "%"
+                             "  COMPOUND=" + str(compound).rjust(8) + "%"
+                             "  " + cap_str + "  " + fscore_str)
+
+            except Exception as e:
+                skipped.append({"name": name, "ticker": symbol, "reason": "Error: " + str(e)[:60], "days_available": 0})
+                print(line + "✗  " + str(e)[:50])
+
+    cols         = np.fromiter(res_col, dtype=np.intp, count=len(res_col))
+    compound_arr = np.round(m3_arr[cols] + m6_arr[cols] + m12_arr[cols], 2)
+    n_valid      = len(cols)
 
     print("")
     print("-" * 65)
-    print("  Valid: " + str(len(results)) + "  Skipped: " + str(len(skipped)))
+    print("  Valid: " + str(n_valid) + "  Skipped: " + str(len(skipped)))
     print("-" * 65)
 
-    # Sort descending by compound score
-    results.sort(key=lambda x: x["compound_score"], reverse=True)
-    for i, r in enumerate(results):
-        r["rank"] = i + 1
-
-    top20 = results[:20]
+    # Partial selection of the TOP_N best compound scores, then sort only those.
+    # Ties are broken by universe order, including at the cutoff: everything
+    # strictly above the TOP_N-th score is kept, then the earliest tied stocks.
+    if n_valid > TOP_N:
+        neg     = -compound_arr
+        cutoff  = neg[np.argpartition(neg, TOP_N - 1)[TOP_N - 1]]
+        above   = np.flatnonzero(neg < cutoff)
+        tied    = np.flatnonzero(neg == cutoff)
+        top_idx = np.concatenate([above, tied[:TOP_N - len(above)]])
+    else:
+        top_idx = np.arange(n_valid)
+    top_idx = top_idx[np.lexsort((top_idx, -compound_arr[top_idx]))]
+
+    top20 = []
+    for rank, k in enumerate(top_idx, start=1):
+        j = cols[k]
+        top20.append({
+            "name":             res_name[k],
+            "ticker":           closes.columns[j],
+            "price":            round(float(price_arr[j]), 2),
+            "mom_3m":           round(float(m3_arr[j]), 2),
+            "mom_6m":           round(float(m6_arr[j]), 2),
+            "mom_12m":          round(float(m12_arr[j]), 2),
+            "compound_score":   float(compound_arr[k]),
+            "market_cap_msek":  res_cap[k],
+            "fscore":           res_fscore[k],
+            "rank":             rank,
+        })
 
     # Attach previous ranks
     prev_ranks = load_prev_ranks()
@@ -466,10 +678,10 @@ def main():
 
     save_prev_ranks(top20)
 
-    # Print top 20
+    # Print top N
     print("")
     print("=" * 65)
-    print("  TOP 20 — COMPOUND MOMENTUM RANKING")
+    print("  TOP " + str(TOP_N) + " — COMPOUND MOMENTUM RANKING")
     print("=" * 65)
     for r in top20:
         prev = "(prev #" + str(r["prev_rank"]) + ")" if r["prev_rank"] else "(new)"
@@ -490,7 +702,7 @@ def main():
     output = {
         "updated":              now.strftime("%Y-%m-%d %H:%M UTC"),
         "total_attempted":      len(TICKERS),
-        "stocks_screened":      len(results),
+        "stocks_screened":      n_valid,
         "skipped_count":        len(skipped),
         "filters": {
             "size_filter":      FILTER_BY_SIZE,
@@ -502,12 +714,11 @@ def main():
         "skipped":              skipped,
     }
 
-    with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_json(output, OUTPUT_JSON)
 
     print("")
     print("✅  Saved → " + OUTPUT_JSON)
-    print("    Universe screened : " + str(len(results)) + " stocks")
+    print("    Universe screened : " + str(n_valid) + " stocks")
     print("    Size filter       : " + size_filter_label)
     print("    F-Score filter    : " + fscore_filter_label)
     print("    Updated           : " + datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))